@@ -1,3 +1,247 @@
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import repeat
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+try:
+    import pandas as pd
+except ImportError:  # pandas is optional, only needed for DataFrame input
+    pd = None
+
+
+# a batch of pitches: list of pitch dictionaries from API, a DataFrame of them, or a PitchBatch
+Pitches = Union[List[Dict], 'pd.DataFrame', 'PitchBatch']
+
+
+# category codes used by the tally kernel, in code order
+CATEGORIES = ('foul', 'in_play', 'whiff', 'called_strike', 'ball', 'hit_by_pitch', 'undefined', 'unknown')
+IN_PLAY_CODE = CATEGORIES.index('in_play')
+UNKNOWN_CODE = CATEGORIES.index('unknown')
+
+
+def _tally_loop(codes: np.ndarray, exit_speeds: np.ndarray, weak_threshold: float, hard_threshold: float):
+    """ count pitches per category code and weak/hard in-play contact in a single pass
+    
+    args:
+        codes: uint8 category code per pitch (see CATEGORIES)
+        exit_speeds: float exit speed per pitch, nan when missing
+        
+    returns:
+        (counts per category code, in-play exit speeds, weak contact count, hard contact count)
+    """
+    counts = np.zeros(len(CATEGORIES), dtype=np.int64)
+    in_play_speeds = np.empty(codes.size, dtype=np.float64)
+    n_speeds = 0
+    weak = 0
+    hard = 0
+    for i in range(codes.size):
+        code = codes[i]
+        counts[code] += 1
+
+        if code == IN_PLAY_CODE:
+            speed = exit_speeds[i]
+            # nan != nan, and a zero speed is not a measurement
+            if speed == speed and speed != 0:
+                in_play_speeds[n_speeds] = speed
+                n_speeds += 1
+                if speed < weak_threshold:
+                    weak += 1
+                if speed >= hard_threshold:
+                    hard += 1
+
+    return counts, in_play_speeds[:n_speeds].copy(), weak, hard
+
+
+def _tally_numpy(codes: np.ndarray, exit_speeds: np.ndarray, weak_threshold: float, hard_threshold: float):
+    """ same result as _tally_loop, built from numpy primitives; the default _tally
+    
+    the in-play speeds are extracted once and both thresholds are applied to that array
+    """
+    counts = np.bincount(codes, minlength=len(CATEGORIES))
+    speeds = exit_speeds[codes == IN_PLAY_CODE]
+    speeds = speeds[np.nan_to_num(speeds) != 0]
+
+    return counts, speeds, int((speeds < weak_threshold).sum()), int((speeds >= hard_threshold).sum())
+
+
+# the numba kernel is opt-in (CONTACT_FILTER_NUMBA=1): importing and compiling it costs more
+# than it saves on a one-off summary, it only pays off in a long-running process
+if os.environ.get('CONTACT_FILTER_NUMBA') == '1':
+    from numba import njit
+    _tally = njit(cache=True)(_tally_loop)
+else:
+    _tally = _tally_numpy
+
+
+def _is_frame(pitches: Pitches) -> bool:
+    """ true if the batch is a DataFrame rather than a list of pitch dictionaries """
+    return pd is not None and isinstance(pitches, pd.DataFrame)
+
+
+def _frame_column(df: 'pd.DataFrame', name: str, dtype, missing) -> np.ndarray:
+    """ one column of a DataFrame as an array, missing values (and a missing column) filled in """
+    if name not in df.columns:
+        return np.full(len(df), missing, dtype=dtype)
+
+    column = df[name]
+    if missing is None:
+        # fillna(None) leaves nan in place, so mask the missing values instead
+        values = column.to_numpy(dtype=dtype, copy=True)
+        values[column.isna().to_numpy()] = None
+        return values
+    return column.fillna(missing).to_numpy(dtype=dtype)
+
+
+def _int_column(values, name: str) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """ a PA field as int64, plus a mask of the pitches where it was an explicit None
+    
+    the mask is None when no pitch had a None; non-integral values are rejected rather than
+    truncated, since 1.5 and 1 name different PAs
+    """
+    column = np.asarray(values)
+    is_none = None
+
+    if column.dtype == object:
+        is_none = np.fromiter((v is None for v in column), dtype=bool, count=column.size)
+        if is_none.any():
+            column = column.copy()
+            column[is_none] = 0
+        else:
+            is_none = None
+        column = np.array(column.tolist())
+
+    if column.size == 0:
+        return np.zeros(0, dtype=np.int64), is_none
+    if column.dtype.kind == 'f':
+        bad = column != np.floor(column)  # also true for nan and inf
+        if bad.any():
+            raise ValueError(f'{name} must be an integer, got {column[bad][0]!r}')
+    elif column.dtype.kind not in 'iub':
+        raise ValueError(f'{name} must be an integer, got {column.flat[0]!r}')
+
+    return column.astype(np.int64), is_none
+
+
+# eq=False: a generated __eq__ would compare the exit speed array and raise
+@dataclass(eq=False)
+class PitchCounts:
+    """ per-category pitch counts, without materializing the pitches themselves
+    
+    weak_contact and hard_contact count in-play pitches below/above the contact thresholds;
+    in_play_exit_speeds holds the non-empty exit speeds of in-play pitches, the only
+    per-pitch values the summaries need
+    """
+
+    foul: int = 0
+    in_play: int = 0
+    whiff: int = 0
+    called_strike: int = 0
+    ball: int = 0
+    hit_by_pitch: int = 0
+    undefined: int = 0
+    unknown: int = 0
+    weak_contact: int = 0
+    hard_contact: int = 0
+    in_play_exit_speeds: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64))
+
+    @property
+    def contact(self) -> int:
+        return self.foul + self.in_play
+
+    @property
+    def non_contact(self) -> int:
+        return self.whiff + self.called_strike + self.ball + self.hit_by_pitch + self.undefined
+
+
+# eq=False: a generated __eq__ would compare the column arrays and raise
+@dataclass(eq=False)
+class PitchBatch:
+    """ columnar layout of a batch of pitches, one array per field the filter reads
+    
+    build it once at ingestion with from_dicts / from_frame and pass it to any ContactFilter
+    method in place of the list of pitch dictionaries; lists and DataFrames passed directly
+    are converted on the way in
+    
+    inning and pa_of_inning are only read for PA counting, so batches built internally leave
+    them as None until add_pa_columns fills them in. an explicit None in either field is
+    recorded in its *_none mask rather than as a value, so it never matches a real one
+    """
+
+    pitch_call: np.ndarray  # object
+    exit_speed: np.ndarray  # float64, nan where missing
+    inning: Optional[np.ndarray] = None  # int64, 0 where missing or None
+    pa_of_inning: Optional[np.ndarray] = None  # int64, 0 where missing or None
+    inning_none: Optional[np.ndarray] = None  # bool, true where inning was None; None if it never was
+    pa_of_inning_none: Optional[np.ndarray] = None  # bool, same for pa_of_inning
+
+    def __len__(self) -> int:
+        return len(self.pitch_call)
+
+    @classmethod
+    def from_dicts(cls, pitches: List[Dict], pa_columns: bool = True) -> 'PitchBatch':
+        """ build the columns from a list of pitch dictionaries from API
+        
+        pa_columns=False skips inning and pa_of_inning, which only PA counting reads
+        """
+        n = len(pitches)
+        pitch_call = np.empty(n, dtype=object)
+        pitch_call[:] = [p.get('pitch_call') for p in pitches]
+
+        batch = cls(
+            pitch_call=pitch_call,
+            # None becomes nan; a zero speed is kept so row() gives it back, the tally skips it
+            exit_speed=np.array([p.get('exit_speed') for p in pitches], dtype=np.float64)
+        )
+        if pa_columns:
+            batch.add_pa_columns(pitches)
+
+        return batch
+
+    @classmethod
+    def from_frame(cls, df: 'pd.DataFrame', pa_columns: bool = True) -> 'PitchBatch':
+        """ build the columns from a DataFrame of pitches
+        
+        a DataFrame cannot tell a None inning from a missing one, both are read as 0
+        """
+        batch = cls(
+            pitch_call=_frame_column(df, 'pitch_call', object, None),
+            exit_speed=_frame_column(df, 'exit_speed', np.float64, np.nan)
+        )
+        if pa_columns:
+            batch.add_pa_columns(df)
+
+        return batch
+
+    def add_pa_columns(self, pitches: Union[List[Dict], 'pd.DataFrame']) -> None:
+        """ fill inning and pa_of_inning from the dicts or DataFrame this batch was built from """
+        if _is_frame(pitches):
+            self.inning, _ = _int_column(_frame_column(pitches, 'inning', object, 0), 'inning')
+            self.pa_of_inning, _ = _int_column(_frame_column(pitches, 'pa_of_inning', object, 0), 'pa_of_inning')
+            return
+
+        self.inning, self.inning_none = _int_column([p.get('inning', 0) for p in pitches], 'inning')
+        self.pa_of_inning, self.pa_of_inning_none = _int_column(
+            [p.get('pa_of_inning', 0) for p in pitches], 'pa_of_inning')
+
+    def row(self, i: int) -> Dict:
+        """ pitch i as a pitch dictionary """
+        exit_speed = float(self.exit_speed[i])
+        row = {
+            'pitch_call': self.pitch_call[i],
+            'exit_speed': exit_speed if exit_speed == exit_speed else None
+        }
+
+        if self.inning is not None:
+            for name, column, is_none in (('inning', self.inning, self.inning_none),
+                                          ('pa_of_inning', self.pa_of_inning, self.pa_of_inning_none)):
+                row[name] = None if is_none is not None and is_none[i] else int(column[i])
+
+        return row
+
+
 class ContactFilter:
     """ filters and analyzes contact events from pitch data
     
@@ -33,9 +277,46 @@ class ContactFilter:
 
     ALL_CALL = {**CONTACT_CALLS, **NON_CONTACT_CALLS}
 
+    # membership-only views of the call tables for is_contact / is_non_contact
+    CONTACT_SET = frozenset(CONTACT_CALLS)
+    NON_CONTACT_SET = frozenset(NON_CONTACT_CALLS)
+
+    # pitch_call -> index into CATEGORIES
+    CALL_CODES = {call: CATEGORIES.index(category) for call, category in ALL_CALL.items()}
+
     WEAK_CONTACT_THRESHOLD = 70
     HARD_CONTACT_THRESHOLD = 95
 
+    # slot of each running stat in stats_arr
+    STAT_IDX = {
+        'total_pitches_processed': 0,
+
+        'contact_events_found': 1,
+        'fouls_found': 2,
+        'in_play_found': 3,
+
+        'non_contact_events_found': 4,
+        'whiffs_found': 5,
+        'called_strikes_found': 6,
+        'balls_found': 7,
+        'hit_by_pitch_found': 8,
+        'undefined_found': 9,
+
+        'unknown_found': 10
+    }
+
+    # stats_arr slot for each category code, in CATEGORIES order
+    CATEGORY_STAT_IDX = np.array([
+        STAT_IDX['fouls_found'],
+        STAT_IDX['in_play_found'],
+        STAT_IDX['whiffs_found'],
+        STAT_IDX['called_strikes_found'],
+        STAT_IDX['balls_found'],
+        STAT_IDX['hit_by_pitch_found'],
+        STAT_IDX['undefined_found'],
+        STAT_IDX['unknown_found']
+    ])
+
     def __init__(self):
         self.reset_stats()
 
@@ -52,7 +333,7 @@ class ContactFilter:
 
         pitch_call = pitch.get('pitch_call')
 
-        return pitch_call in self.CONTACT_CALLS
+        return pitch_call in self.CONTACT_SET
     
     def is_non_contact(self, pitch: Dict) -> bool:
         """ check if a pitch resulted in non-contact
@@ -66,7 +347,7 @@ class ContactFilter:
         """
         pitch_call = pitch.get('pitch_call')
 
-        return pitch_call in self.NON_CONTACT_CALLS
+        return pitch_call in self.NON_CONTACT_SET
 
 
     def get_event_category(self, pitch: Dict) -> str:
@@ -78,20 +359,58 @@ class ContactFilter:
             'hit_by_pitch', 'undefined', or 'unknown')
             """
         
-        pitch_call = pitch.get('pitch_call')
+        return self.ALL_CALL.get(pitch.get('pitch_call'), 'unknown')
+        
+    def _call_codes(self, pitch_call: np.ndarray) -> np.ndarray:
+        """ map every pitch_call in a batch to its category code in one pass
+        
+        returns:
+            np.ndarray: uint8 code per pitch, UNKNOWN_CODE for unrecognized or missing calls
+        """
+        # map() drives the bound dict.get from C, so there is no Python frame per pitch
+        code_of = self.CALL_CODES.get
+        return np.fromiter(map(code_of, pitch_call, repeat(UNKNOWN_CODE)),
+                           dtype=np.uint8, count=len(pitch_call))
 
-        if pitch_call in self.CONTACT_CALLS:
-            return self.CONTACT_CALLS[pitch_call]
-        elif pitch_call in self.NON_CONTACT_CALLS:
-            return self.NON_CONTACT_CALLS[pitch_call]
-        else:
-            return 'unknown'
+    def _batch(self, pitches: Pitches) -> Tuple[PitchBatch, np.ndarray]:
+        """ columnar batch and category codes for the pitches
         
-    def categorize_pitches(self, pitches: List[Dict]) -> Dict[str, List[Dict]]:
+        the result for the most recent batch is memoized: callers treat the pitch list as
+        read-only within a summary flow, so the same object with the same length is reused
+        """
+        cache = self._cache
+        if cache is not None and cache[0] is pitches and cache[1] == len(pitches):
+            return cache[2]
+
+        # the PA columns are left for count_plate_appearances_by_contact to add
+        if isinstance(pitches, PitchBatch):
+            batch = pitches
+        elif _is_frame(pitches):
+            batch = PitchBatch.from_frame(pitches, pa_columns=False)
+        else:
+            batch = PitchBatch.from_dicts(pitches, pa_columns=False)
+
+        columns = (batch, self._call_codes(batch.pitch_call))
+        # holding the batch itself keeps its id from being reused while cached
+        self._cache = (pitches, len(pitches), columns)
+
+        return columns
+
+    def _update_stats(self, total: int, counts: np.ndarray) -> None:
+        """ add per-category counts (indexed by category code) from one categorization pass to the running stats """
+        stats_arr = self.stats_arr
+        stat_idx = self.STAT_IDX
+
+        stats_arr[stat_idx['total_pitches_processed']] += total
+        stats_arr[self.CATEGORY_STAT_IDX] += counts
+        stats_arr[stat_idx['contact_events_found']] += counts[:IN_PLAY_CODE + 1].sum()
+        stats_arr[stat_idx['non_contact_events_found']] += counts[IN_PLAY_CODE + 1:UNKNOWN_CODE].sum()
+
+    def categorize_pitches(self, pitches: Pitches) -> Dict[str, List[Dict]]:
         """ split pitches into contact and non-contact categories
         
         args:
-            pitches: list of pitch dictionaries from API
+            pitches: list of pitch dictionaries, DataFrame or PitchBatch
             
         returns:
             dict: dictionary with keys 'contact' and 'non_contact', each containing a list of 
@@ -116,78 +435,143 @@ class ContactFilter:
             }
         """
 
-        self.stats['total_pitches_processed'] += len(pitches)
+        _, codes = self._batch(pitches)
+        counts = np.bincount(codes, minlength=len(CATEGORIES))
+        self._update_stats(len(pitches), counts)
+
+        # each bucket is gathered in one go from exact per-category sizes instead of growing by append
+        if _is_frame(pitches):
+            def bucket(indices: np.ndarray) -> List[Dict]:
+                return pitches.iloc[indices].to_dict('records')
+        elif isinstance(pitches, PitchBatch):
+            def bucket(indices: np.ndarray) -> List[Dict]:
+                return [pitches.row(i) for i in indices]
+        else:
+            # the original dicts, so callers get their own pitches back
+            items = np.empty(len(pitches), dtype=object)
+            items[:] = pitches
+
+            def bucket(indices: np.ndarray) -> List[Dict]:
+                return items[indices].tolist()
+
+        # one stable sort groups pitch indices by category code (input order kept within a
+        # category) and the bincount above gives where each category starts and ends
+        order = np.argsort(codes, kind='stable')
+        bounds = np.concatenate(([0], np.cumsum(counts)))
+
+        def category(name: str) -> List[Dict]:
+            code = CATEGORIES.index(name)
+            return bucket(order[bounds[code]:bounds[code + 1]])
+
+        # contact codes ('foul', 'in_play') come first in CATEGORIES
+        is_contact = codes <= IN_PLAY_CODE
+        is_non_contact = ~is_contact & (codes != UNKNOWN_CODE)
 
         result = {
             'contact': {
-                'foul': [],
-                'in_play': [],
-                'all': []
+                'foul': category('foul'),
+                'in_play': category('in_play'),
+                'all': bucket(np.flatnonzero(is_contact))
             },
             'non_contact': {
-                'whiff': [],
-                'called_strike': [],
-                'ball': [],
-                'hit_by_pitch': [],
-                'undefined': [],
-                'all': []
+                'whiff': category('whiff'),
+                'called_strike': category('called_strike'),
+                'ball': category('ball'),
+                'hit_by_pitch': category('hit_by_pitch'),
+                'undefined': category('undefined'),
+                'all': bucket(np.flatnonzero(is_non_contact))
             },
-            'unknown': []
+            'unknown': category('unknown')
         }
 
-        for pitch in pitches:
-            category = self.get_event_category(pitch)
+        return result
+    
+    def stream_categorize(self, pitches: Pitches) -> Iterator[Tuple[str, Dict]]:
+        """ yield (category, pitch) for every pitch, in order, without building per-category lists
+        
+        each pitch is looked up and counted in the stats as it is yielded, so no per-batch
+        arrays are built and a stream that is stopped early only counts what it yielded
+        
+        args:
+            pitches: list of pitch dictionaries, DataFrame or PitchBatch
             
-            if category in ['foul', 'in_play']:
-                # contact
-                result['contact'][category].append(pitch)
-                result['contact']['all'].append(pitch)
-                self.stats['contact_events_found'] += 1
-                
-                if category == 'foul':
-                    self.stats['fouls_found'] += 1
-                elif category == 'in_play':
-                    self.stats['in_play_found'] += 1
-                    
-            elif category in ['whiff', 'called_strike', 'ball', 'hit_by_pitch', 'undefined']:
-                # non-contact 
-                result['non_contact'][category].append(pitch)
-                result['non_contact']['all'].append(pitch)
-                self.stats['non_contact_events_found'] += 1
-                
-                # track specific non-contact types
-                if category == 'whiff':
-                    self.stats['whiffs_found'] += 1
-                elif category == 'called_strike':
-                    self.stats['called_strikes_found'] += 1
-                elif category == 'ball':
-                    self.stats['balls_found'] += 1
-                elif category == 'hit_by_pitch':
-                    self.stats['hit_by_pitch_found'] += 1
-                elif category == 'undefined':
-                    self.stats['undefined_found'] += 1
-                    
-            else:
-                # unknown 
-                result['unknown'].append(pitch)
-                self.stats['unknown_found'] += 1
+        yields:
+            tuple: (category, pitch) where category is one of CATEGORIES
+        """
+
+        call_codes = self.CALL_CODES
+        category_stat_idx = self.CATEGORY_STAT_IDX.tolist()
+        total_idx = self.STAT_IDX['total_pitches_processed']
+        contact_idx = self.STAT_IDX['contact_events_found']
+        non_contact_idx = self.STAT_IDX['non_contact_events_found']
+
+        # DataFrame and PitchBatch rows are converted one at a time rather than all up front
+        if _is_frame(pitches):
+            records = (row.to_dict() for _, row in pitches.iterrows())
+        elif isinstance(pitches, PitchBatch):
+            records = (pitches.row(i) for i in range(len(pitches)))
+        else:
+            records = pitches
+        for pitch in records:
+            code = call_codes.get(pitch.get('pitch_call'), UNKNOWN_CODE)
+
+            # looked up per pitch so a reset_stats() mid-stream is respected
+            stats_arr = self.stats_arr
+            stats_arr[total_idx] += 1
+            stats_arr[category_stat_idx[code]] += 1
+            if code <= IN_PLAY_CODE:
+                stats_arr[contact_idx] += 1
+            elif code != UNKNOWN_CODE:
+                stats_arr[non_contact_idx] += 1
+
+            yield CATEGORIES[code], pitch
+
+    def categorize_counts(self, pitches: Pitches) -> PitchCounts:
+        """ count pitches per category without building the per-category pitch lists
         
-        return result
+        use this instead of categorize_pitches when only the counts are needed
+        
+        args:
+            pitches: list of pitch dictionaries, DataFrame or PitchBatch
+            
+        returns:
+            PitchCounts: counts per category plus the in-play exit speeds
+        """
+
+        batch, codes = self._batch(pitches)
+
+        # categorization, in-play speed extraction and exit velo thresholding in one pass
+        tally, in_play_speeds, weak, hard = _tally(codes, batch.exit_speed,
+                                                   float(self.WEAK_CONTACT_THRESHOLD),
+                                                   float(self.HARD_CONTACT_THRESHOLD))
+        self._update_stats(len(pitches), tally)
+        counts = dict(zip(CATEGORIES, tally.tolist()))
+
+        return PitchCounts(weak_contact=int(weak), hard_contact=int(hard), in_play_exit_speeds=in_play_speeds, **counts)
     
-    def get_contact_summary(self, pitches: List[Dict]) -> Dict:
+    def _rates(self, counts: List[int], total_pitches: int) -> List[float]:
+        """ each count as a percentage of total_pitches rounded to 0.1 (all 0 without pitches) """
+        if total_pitches <= 0:
+            return [0] * len(counts)
+
+        # Python round, not np.round: the two disagree on some values from 2000 pitches up
+        return [round(count / total_pitches * 100, 1) for count in counts]
+
+    def get_contact_summary(self, pitches: Pitches) -> Dict:
         """
         generate detailed summary statistics for contact events only.
         
         args:
-            pitches: List of pitch dictionaries (will be filtered to contact)
+            pitches: list of pitch dictionaries, DataFrame or PitchBatch (will be filtered to contact)
             
         returns:
             dictionary with comprehensive contact statistics
         """
-        categorized = self.categorize_pitches(pitches)
-        contact_pitches = categorized['contact']['all']
-        
-        if not contact_pitches:
+        return self._contact_summary_from(self.categorize_counts(pitches), len(pitches))
+
+    def _contact_summary_from(self, counts: PitchCounts, total_pitches: int) -> Dict:
+        """ build the contact summary from an existing categorization """
+        if not counts.contact:
             return {
                 'total_contacts': 0,
                 'fouls': 0,
@@ -201,208 +585,231 @@ class ContactFilter:
                 'in_play_rate': 0
             }
         
-        # in-play pitches for exit velocity analysis
-        in_play_pitches = categorized['contact']['in_play']
-        exit_speeds = [p.get('exit_speed', 0) for p in in_play_pitches if p.get('exit_speed')]
+        # in-play exit speeds for exit velocity analysis
+        exit_speeds = counts.in_play_exit_speeds
         
-        weak_contact = [s for s in exit_speeds if s < self.WEAK_CONTACT_THRESHOLD]
-        hard_contact = [s for s in exit_speeds if s >= self.HARD_CONTACT_THRESHOLD]
+        if exit_speeds.size:
+            # one sort for all three percentiles
+            q25, q50, q75 = np.percentile(exit_speeds, [25, 50, 75])
+            avg_exit_velo = round(float(exit_speeds.mean()), 1)
+            max_exit_velo = float(exit_speeds.max())
+            # numpy rounding, as pandas quantiles were rounded before; float() after for plain floats
+            exit_velo_percentiles = {
+                '25th': float(round(q25, 1)),
+                '50th': float(round(q50, 1)),
+                '75th': float(round(q75, 1))
+            }
+        else:
+            avg_exit_velo = 0
+            max_exit_velo = 0
+            exit_velo_percentiles = {}
         
-        total_pitches = len(pitches)
-        contact_rate = (len(contact_pitches) / total_pitches * 100) if total_pitches > 0 else 0
+        contact_rate, foul_rate, in_play_rate = self._rates([counts.contact, counts.foul, counts.in_play],
+                                                            total_pitches)
         
         return {
-            'total_contacts': len(contact_pitches),
-            'fouls': len(categorized['contact']['foul']),
-            'in_play': len(in_play_pitches),
-            'weak_contact': len(weak_contact),
-            'hard_contact': len(hard_contact),
+            'total_contacts': counts.contact,
+            'fouls': counts.foul,
+            'in_play': counts.in_play,
+            'weak_contact': counts.weak_contact,
+            'hard_contact': counts.hard_contact,
             
-            'contact_rate': round(contact_rate, 1),
-            'foul_rate': round(len(categorized['contact']['foul']) / total_pitches * 100, 1) if total_pitches > 0 else 0,
-            'in_play_rate': round(len(in_play_pitches) / total_pitches * 100, 1) if total_pitches > 0 else 0,
+            'contact_rate': contact_rate,
+            'foul_rate': foul_rate,
+            'in_play_rate': in_play_rate,
             
-            'avg_exit_velo': round(sum(exit_speeds) / len(exit_speeds), 1) if exit_speeds else 0,
-            'max_exit_velo': max(exit_speeds) if exit_speeds else 0,
-            'exit_velo_percentiles': {
-                '25th': round(pd.Series(exit_speeds).quantile(0.25), 1) if exit_speeds else 0,
-                '50th': round(pd.Series(exit_speeds).quantile(0.50), 1) if exit_speeds else 0,
-                '75th': round(pd.Series(exit_speeds).quantile(0.75), 1) if exit_speeds else 0
-            } if exit_speeds else {}
+            'avg_exit_velo': avg_exit_velo,
+            'max_exit_velo': max_exit_velo,
+            'exit_velo_percentiles': exit_velo_percentiles
         }
     
-    def get_non_contact_summary(self, pitches: List[Dict]) -> Dict:
+    def get_non_contact_summary(self, pitches: Pitches) -> Dict:
         """
         generate detailed summary statistics for non-contact events.
         (for other parts of the project to use)
         
         args:
-            pitches: List of pitch dictionaries
+            pitches: list of pitch dictionaries, DataFrame or PitchBatch
             
         returns:
             dictionary with comprehensive non-contact statistics
         """
 
-        categorized = self.categorize_pitches(pitches)
-        non_contact = categorized['non_contact']
-        total_pitches = len(pitches)
+        return self._non_contact_summary_from(self.categorize_counts(pitches), len(pitches))
+
+    def _non_contact_summary_from(self, counts: PitchCounts, total_pitches: int) -> Dict:
+        """ build the non-contact summary from an existing categorization """
+        swings = counts.whiff + counts.contact  # whiffs + contacts
+        whiff_rate, called_strike_rate, ball_rate, hit_by_pitch_rate, swing_rate = self._rates(
+            [counts.whiff, counts.called_strike, counts.ball, counts.hit_by_pitch, swings], total_pitches)
         
         return {
-            'total_non_contacts': len(non_contact['all']),
-            'whiffs': len(non_contact['whiff']),
-            'called_strikes': len(non_contact['called_strike']),
-            'balls': len(non_contact['ball']),
-            'hit_by_pitch': len(non_contact['hit_by_pitch']),
-            'undefined': len(non_contact['undefined']),
+            'total_non_contacts': counts.non_contact,
+            'whiffs': counts.whiff,
+            'called_strikes': counts.called_strike,
+            'balls': counts.ball,
+            'hit_by_pitch': counts.hit_by_pitch,
+            'undefined': counts.undefined,
             
-            'whiff_rate': round(len(non_contact['whiff']) / total_pitches * 100, 1) if total_pitches > 0 else 0,
-            'called_strike_rate': round(len(non_contact['called_strike']) / total_pitches * 100, 1) if total_pitches > 0 else 0,
-            'ball_rate': round(len(non_contact['ball']) / total_pitches * 100, 1) if total_pitches > 0 else 0,
-            'hit_by_pitch_rate': round(len(non_contact['hit_by_pitch']) / total_pitches * 100, 1) if total_pitches > 0 else 0,
+            'whiff_rate': whiff_rate,
+            'called_strike_rate': called_strike_rate,
+            'ball_rate': ball_rate,
+            'hit_by_pitch_rate': hit_by_pitch_rate,
             
-            'swings': len(non_contact['whiff']) + len(categorized['contact']['all']),  # whiffs + contacts
-            'swing_rate': round((len(non_contact['whiff']) + len(categorized['contact']['all'])) / total_pitches * 100, 1) if total_pitches > 0 else 0,
-            'whiff_per_swing': round(len(non_contact['whiff']) / (len(non_contact['whiff']) + len(categorized['contact']['all'])) * 100, 1) 
-                              if (len(non_contact['whiff']) + len(categorized['contact']['all'])) > 0 else 0
+            'swings': swings,
+            'swing_rate': swing_rate,
+            'whiff_per_swing': round(counts.whiff / swings * 100, 1) if swings > 0 else 0
         }
     
-    def get_complete_summary(self, pitches: List[Dict]) -> Dict:
+    def get_complete_summary(self, pitches: Pitches) -> Dict:
         """
         get complete summary of all pitch events (both contact and non-contact).
         
         args:
-            pitches: List of all pitch dictionaries
+            pitches: all pitches, as a list of pitch dictionaries, DataFrame or PitchBatch
             
         returns:
             dictionary with everything
         """
+        # categorize once and share it between both summaries
+        counts = self.categorize_counts(pitches)
+        total_pitches = len(pitches)
+
         return {
-            'contact': self.get_contact_summary(pitches),
-            'non_contact': self.get_non_contact_summary(pitches),
+            'contact': self._contact_summary_from(counts, total_pitches),
+            'non_contact': self._non_contact_summary_from(counts, total_pitches),
             'totals': {
                 'pitches_analyzed': len(pitches),
                 'timestamp': datetime.now().isoformat()
             }
         }
     
-    def count_contact_plate_appearances(self, pitches: List[Dict]) -> int:
+    def _pa_field_ids(self, values: np.ndarray, is_none: Optional[np.ndarray]) -> np.ndarray:
+        """ dense id per distinct value of a PA field, explicit Nones getting an id of their own """
+        ids = np.unique(values, return_inverse=True)[1]
+        if is_none is not None:
+            ids[is_none] = ids.size
+
+        return ids
+
+    def _pa_keys(self, pitches: Pitches, batch: PitchBatch) -> np.ndarray:
+        """ one int64 key per pitch identifying its PA (inning + pa_of_inning) """
+        if batch.inning is None:
+            if isinstance(pitches, PitchBatch):
+                raise ValueError('PitchBatch has no PA columns, build it with pa_columns=True to count PAs')
+            # built here rather than in _batch, and kept on the cached batch
+            batch.add_pa_columns(pitches)
+
+        inning, pa_of_inning = batch.inning, batch.pa_of_inning
+        bound = 1 << 31
+        if not (batch.inning_none is None and batch.pa_of_inning_none is None and
+                -bound < inning.min(initial=0) and inning.max(initial=0) < bound and
+                -bound < pa_of_inning.min(initial=0) and pa_of_inning.max(initial=0) < bound):
+            # renumber densely so both fit in 32 bits, with None as one more value of its own
+            inning = self._pa_field_ids(inning, batch.inning_none)
+            pa_of_inning = self._pa_field_ids(pa_of_inning, batch.pa_of_inning_none)
+
+        # both 32-bit fields packed into one key, so distinct PAs never collide
+        return inning.astype(np.int64) * (1 << 32) + pa_of_inning
+
+    def count_plate_appearances_by_contact(self, pitches: Pitches) -> Tuple[int, int]:
+        """
+        count plate appearances with and without contact in a single pass.
+        
+        args:
+            pitches: ALL pitches (not just contact), as a list, DataFrame or PitchBatch
+            
+        returns:
+            (PAs with at least one contact, PAs with zero contact events)
+        """
+        batch, codes = self._batch(pitches)
+        pa_keys = self._pa_keys(pitches, batch)
+
+        # one sort groups the pitches by PA, then count contact pitches per PA
+        pas, pa_of_pitch = np.unique(pa_keys, return_inverse=True)
+        # contact codes ('foul', 'in_play') come first in CATEGORIES
+        contacts_per_pa = np.bincount(pa_of_pitch[codes <= IN_PLAY_CODE], minlength=pas.size)
+        contact_pas = int(np.count_nonzero(contacts_per_pa))
+
+        return contact_pas, pas.size - contact_pas
+
+    def count_contact_plate_appearances(self, pitches: Pitches) -> int:
         """
         count plate appearances where batter made at least one contact.
         
         Args:
-            pitches: list of ALL pitches (not just contact)
+            pitches: ALL pitches (not just contact), as a list, DataFrame or PitchBatch
             
         Returns:
             number of PAs with at least one contact
         """
-        # group pitches by PA (inning + pa_of_inning)
-        pa_map = {}
-        for pitch in pitches:
-            inning = pitch.get('inning', 0)
-            pa_num = pitch.get('pa_of_inning', 0)
-            pa_key = f"{inning}_{pa_num}"
-            
-            if pa_key not in pa_map:
-                pa_map[pa_key] = []
-            pa_map[pa_key].append(pitch)
-        
-        # count PAs with at least one contact
-        contact_pas = 0
-        for pa_pitches in pa_map.values():
-            if any(self.is_contact(p) for p in pa_pitches):
-                contact_pas += 1
-        
-        return contact_pas
+        return self.count_plate_appearances_by_contact(pitches)[0]
     
-    def count_non_contact_plate_appearances(self, pitches: List[Dict]) -> int:
+    def count_non_contact_plate_appearances(self, pitches: Pitches) -> int:
         """
         Count plate appearances with NO contact (all non-contact).
         Useful for understanding completely non-competitive PAs.
         
         Args:
-            pitches: List of ALL pitches
+            pitches: ALL pitches, as a list, DataFrame or PitchBatch
             
         Returns:
             Number of PAs with zero contact events
         """
-        # group pitches by PA
-        pa_map = {}
-        for pitch in pitches:
-            inning = pitch.get('inning', 0)
-            pa_num = pitch.get('pa_of_inning', 0)
-            pa_key = f"{inning}_{pa_num}"
-            
-            if pa_key not in pa_map:
-                pa_map[pa_key] = []
-            pa_map[pa_key].append(pitch)
-        
-        # count PAs with no contact
-        non_contact_pas = 0
-        for pa_pitches in pa_map.values():
-            if not any(self.is_contact(p) for p in pa_pitches):
-                non_contact_pas += 1
-        
-        return non_contact_pas
+        return self.count_plate_appearances_by_contact(pitches)[1]
     
     def reset_stats(self):
-        """Reset all internal statistics counters."""
-        self.stats = {
-            'total_pitches_processed': 0,
-            
-            'contact_events_found': 0,
-            'fouls_found': 0,
-            'in_play_found': 0,
-            
-            'non_contact_events_found': 0,
-            'whiffs_found': 0,
-            'called_strikes_found': 0,
-            'balls_found': 0,
-            'hit_by_pitch_found': 0,
-            'undefined_found': 0,
-            
-            'unknown_found': 0
-        }
+        """Reset all internal statistics counters (and the categorization cache)."""
+        self._cache = None
+        self.stats_arr = np.zeros(len(self.STAT_IDX), dtype=np.int64)
     
     def get_stats(self) -> Dict:
         """Return current statistics."""
-        return self.stats.copy()
+        stats_arr = self.stats_arr
+        return {name: int(stats_arr[i]) for name, i in self.STAT_IDX.items()}
     
-    def print_summary(self, pitches: List[Dict]) -> None:
+    def print_summary(self, pitches: Pitches) -> None:
         """
         Pretty-print a summary of pitch categorization.
         Useful for debugging and exploration.
         
         Args:
-            pitches: List of pitch dictionaries
+            pitches: list of pitch dictionaries, DataFrame or PitchBatch
         """
         summary = self.get_complete_summary(pitches)
+        contact = summary['contact']
+        non_contact = summary['non_contact']
         
-        print("=" * 50)
-        print("PITCH CATEGORIZATION SUMMARY")
-        print("=" * 50)
-        print(f"Total pitches analyzed: {summary['totals']['pitches_analyzed']}")
-        print()
-        
-        print("CONTACT EVENTS:")
-        print(f"  Total contacts: {summary['contact']['total_contacts']}")
-        print(f"  ├─ Fouls: {summary['contact']['fouls']} ({summary['contact']['foul_rate']}%)")
-        print(f"  └─ In Play: {summary['contact']['in_play']} ({summary['contact']['in_play_rate']}%)")
-        print(f"     ├─ Weak (<70 mph): {summary['contact']['weak_contact']}")
-        print(f"     ├─ Hard (≥95 mph): {summary['contact']['hard_contact']}")
-        print(f"     └─ Avg Exit Velo: {summary['contact']['avg_exit_velo']} mph")
-        print()
-        
-        print("NON-CONTACT EVENTS:")
-        print(f"  Total non-contacts: {summary['non_contact']['total_non_contacts']}")
-        print(f"  ├─ Whiffs: {summary['non_contact']['whiffs']} ({summary['non_contact']['whiff_rate']}%)")
-        print(f"  ├─ Called Strikes: {summary['non_contact']['called_strikes']} ({summary['non_contact']['called_strike_rate']}%)")
-        print(f"  ├─ Balls: {summary['non_contact']['balls']} ({summary['non_contact']['ball_rate']}%)")
-        print(f"  ├─ Hit By Pitch: {summary['non_contact']['hit_by_pitch']} ({summary['non_contact']['hit_by_pitch_rate']}%)")
-        print(f"  └─ Undefined: {summary['non_contact']['undefined']}")
-        print()
-        
-        print("SWING METRICS:")
-        print(f"  Total Swings: {summary['non_contact']['swings']}")
-        print(f"  Swing Rate: {summary['non_contact']['swing_rate']}%")
-        print(f"  Whiff per Swing: {summary['non_contact']['whiff_per_swing']}%")
-        print("=" * 50)
+        # build the whole report first and write it with a single print
+        lines = [
+            "=" * 50,
+            "PITCH CATEGORIZATION SUMMARY",
+            "=" * 50,
+            f"Total pitches analyzed: {summary['totals']['pitches_analyzed']}",
+            "",
+            
+            "CONTACT EVENTS:",
+            f"  Total contacts: {contact['total_contacts']}",
+            f"  ├─ Fouls: {contact['fouls']} ({contact['foul_rate']}%)",
+            f"  └─ In Play: {contact['in_play']} ({contact['in_play_rate']}%)",
+            f"     ├─ Weak (<70 mph): {contact['weak_contact']}",
+            f"     ├─ Hard (≥95 mph): {contact['hard_contact']}",
+            f"     └─ Avg Exit Velo: {contact['avg_exit_velo']} mph",
+            "",
+            
+            "NON-CONTACT EVENTS:",
+            f"  Total non-contacts: {non_contact['total_non_contacts']}",
+            f"  ├─ Whiffs: {non_contact['whiffs']} ({non_contact['whiff_rate']}%)",
+            f"  ├─ Called Strikes: {non_contact['called_strikes']} ({non_contact['called_strike_rate']}%)",
+            f"  ├─ Balls: {non_contact['balls']} ({non_contact['ball_rate']}%)",
+            f"  ├─ Hit By Pitch: {non_contact['hit_by_pitch']} ({non_contact['hit_by_pitch_rate']}%)",
+            f"  └─ Undefined: {non_contact['undefined']}",
+            "",
+            
+            "SWING METRICS:",
+            f"  Total Swings: {non_contact['swings']}",
+            f"  Swing Rate: {non_contact['swing_rate']}%",
+            f"  Whiff per Swing: {non_contact['whiff_per_swing']}%",
+            "=" * 50
+        ]
+        print("\n".join(lines))
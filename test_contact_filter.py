@@ -0,0 +1,326 @@
+""" tests for contact_filter.ContactFilter
+
+expected values were produced by the original pure-python implementation of
+ContactFilter on the same pitches
+"""
+
+import math
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from contact_filter import ContactFilter, PitchBatch, _tally_loop, _tally_numpy
+
+
+PITCHES = [
+    {'pitch_call': 'InPlay', 'exit_speed': 101.2, 'inning': 1, 'pa_of_inning': 1},
+    {'pitch_call': 'FoulBall', 'exit_speed': 88.0, 'inning': 1, 'pa_of_inning': 2},
+    {'pitch_call': 'StrikeSwinging', 'inning': 1, 'pa_of_inning': 2},
+    {'pitch_call': 'InPlay', 'exit_speed': 64.5, 'inning': 1, 'pa_of_inning': 2},
+    {'pitch_call': 'BallCalled', 'inning': 2, 'pa_of_inning': 1},
+    {'pitch_call': 'StrikeCalled', 'inning': 2, 'pa_of_inning': 1},
+    {'pitch_call': 'InPlay', 'exit_speed': None, 'inning': 2, 'pa_of_inning': 1},
+    {'pitch_call': 'InPlay', 'exit_speed': 0, 'inning': 2, 'pa_of_inning': 2},
+    {'pitch_call': 'HitByPitch', 'inning': 2, 'pa_of_inning': 3},
+    {'pitch_call': 'FoulBallNotFieldable', 'inning': 3, 'pa_of_inning': 1},
+    {'pitch_call': 'InPlay', 'exit_speed': 95.0, 'inning': 3, 'pa_of_inning': 1},
+    {'pitch_call': 'Undefined', 'inning': 3, 'pa_of_inning': 2},
+    {'inning': 3, 'pa_of_inning': 3},  # missing pitch_call
+    {'pitch_call': 'Bogus', 'inning': 3, 'pa_of_inning': 3},
+]
+
+CONTACT_SUMMARY = {
+    'total_contacts': 7,
+    'fouls': 2,
+    'in_play': 5,
+    'weak_contact': 1,
+    'hard_contact': 2,
+    'contact_rate': 50.0,
+    'foul_rate': 14.3,
+    'in_play_rate': 35.7,
+    'avg_exit_velo': 86.9,
+    'max_exit_velo': 101.2,
+    'exit_velo_percentiles': {'25th': 79.8, '50th': 95.0, '75th': 98.1}
+}
+
+NON_CONTACT_SUMMARY = {
+    'total_non_contacts': 5,
+    'whiffs': 1,
+    'called_strikes': 1,
+    'balls': 1,
+    'hit_by_pitch': 1,
+    'undefined': 1,
+    'whiff_rate': 7.1,
+    'called_strike_rate': 7.1,
+    'ball_rate': 7.1,
+    'hit_by_pitch_rate': 7.1,
+    'swings': 8,
+    'swing_rate': 57.1,
+    'whiff_per_swing': 12.5
+}
+
+STATS = {
+    'total_pitches_processed': 14,
+    'contact_events_found': 7,
+    'fouls_found': 2,
+    'in_play_found': 5,
+    'non_contact_events_found': 5,
+    'whiffs_found': 1,
+    'called_strikes_found': 1,
+    'balls_found': 1,
+    'hit_by_pitch_found': 1,
+    'undefined_found': 1,
+    'unknown_found': 2
+}
+
+
+def test_complete_summary():
+    summary = ContactFilter().get_complete_summary(PITCHES)
+
+    assert summary['contact'] == CONTACT_SUMMARY
+    assert summary['non_contact'] == NON_CONTACT_SUMMARY
+    assert summary['totals']['pitches_analyzed'] == len(PITCHES)
+
+
+def test_complete_summary_counts_stats_once():
+    contact_filter = ContactFilter()
+    contact_filter.get_complete_summary(PITCHES)
+
+    assert contact_filter.get_stats() == STATS
+
+
+def test_nan_exit_speed_is_treated_as_missing():
+    pitches = [dict(p, exit_speed=math.nan) if 'exit_speed' in p and p['exit_speed'] is None else p
+               for p in PITCHES]
+
+    assert ContactFilter().get_contact_summary(pitches) == CONTACT_SUMMARY
+
+
+def test_dataframe_input_matches_list_input():
+    pd = pytest.importorskip('pandas')
+    contact_filter = ContactFilter()
+
+    assert contact_filter.get_contact_summary(pd.DataFrame(PITCHES)) == CONTACT_SUMMARY
+    assert contact_filter.get_non_contact_summary(pd.DataFrame(PITCHES)) == NON_CONTACT_SUMMARY
+
+
+def test_percentiles_round_like_numpy():
+    summary = ContactFilter().get_contact_summary([{'pitch_call': 'InPlay', 'exit_speed': 95.55}])
+
+    assert summary['exit_velo_percentiles'] == {'25th': 95.6, '50th': 95.6, '75th': 95.6}
+    assert type(summary['exit_velo_percentiles']['50th']) is float
+
+
+def test_empty_list():
+    summary = ContactFilter().get_complete_summary([])
+
+    assert summary['contact'] == {
+        'total_contacts': 0,
+        'fouls': 0,
+        'in_play': 0,
+        'weak_contact': 0,
+        'hard_contact': 0,
+        'avg_exit_velo': 0,
+        'max_exit_velo': 0,
+        'contact_rate': 0,
+        'foul_rate': 0,
+        'in_play_rate': 0
+    }
+    assert summary['non_contact']['total_non_contacts'] == 0
+    assert summary['non_contact']['whiff_per_swing'] == 0
+
+
+def test_categorize_pitches_returns_the_original_dicts():
+    result = ContactFilter().categorize_pitches(PITCHES)
+
+    assert [p['exit_speed'] for p in result['contact']['in_play']] == [101.2, 64.5, None, 0, 95.0]
+    assert result['contact']['all'][0] is PITCHES[0]
+    assert len(result['non_contact']['all']) == 5
+    assert result['unknown'] == [PITCHES[12], PITCHES[13]]
+
+
+def test_count_plate_appearances():
+    contact_filter = ContactFilter()
+
+    assert contact_filter.count_contact_plate_appearances(PITCHES) == 5
+    assert contact_filter.count_non_contact_plate_appearances(PITCHES) == 3
+
+
+def test_tally_implementations_agree():
+    rng = np.random.default_rng(0)
+    codes = rng.integers(0, 8, 5000).astype(np.uint8)
+    exit_speeds = rng.uniform(40, 115, 5000)
+    exit_speeds[::7] = np.nan
+    exit_speeds[::11] = 0
+
+    expected = _tally_loop(codes, exit_speeds, 70.0, 95.0)
+    actual = _tally_numpy(codes, exit_speeds, 70.0, 95.0)
+
+    np.testing.assert_array_equal(actual[0], expected[0])
+    np.testing.assert_array_equal(actual[1], expected[1])
+    assert actual[2:] == expected[2:]
+
+
+def test_compiled_tally_agrees_with_numpy_fallback():
+    numba = pytest.importorskip('numba')
+    rng = np.random.default_rng(1)
+    codes = rng.integers(0, 8, 5000).astype(np.uint8)
+    exit_speeds = rng.uniform(40, 115, 5000)
+    exit_speeds[::5] = np.nan
+
+    expected = _tally_numpy(codes, exit_speeds, 70.0, 95.0)
+    actual = numba.njit(_tally_loop)(codes, exit_speeds, 70.0, 95.0)
+
+    np.testing.assert_array_equal(actual[0], expected[0])
+    np.testing.assert_array_equal(actual[1], expected[1])
+    assert actual[2:] == expected[2:]
+
+
+def test_numba_is_not_imported_by_default():
+    code = "import sys, contact_filter; assert 'numba' not in sys.modules"
+    env = {'PYTHONPATH': os.path.dirname(os.path.abspath(__file__))}
+    subprocess.run([sys.executable, '-c', code], check=True, env=env)
+
+
+def test_cache_is_keyed_on_batch_and_length():
+    contact_filter = ContactFilter()
+    pitches = list(PITCHES)
+    first = contact_filter.categorize_counts(pitches).contact
+
+    pitches.append({'pitch_call': 'InPlay', 'exit_speed': 99.0})
+
+    assert contact_filter.categorize_counts(pitches).contact == first + 1
+    assert contact_filter.categorize_counts(list(PITCHES)).contact == first
+    assert contact_filter.get_stats()['total_pitches_processed'] == 3 * len(PITCHES) + 1
+
+
+def test_stream_categorize_matches_categorize_pitches():
+    contact_filter = ContactFilter()
+    streamed = list(contact_filter.stream_categorize(PITCHES))
+
+    assert [pitch for _, pitch in streamed] == PITCHES
+    assert [category for category, _ in streamed] == [
+        'in_play', 'foul', 'whiff', 'in_play', 'ball', 'called_strike', 'in_play',
+        'in_play', 'hit_by_pitch', 'foul', 'in_play', 'undefined', 'unknown', 'unknown'
+    ]
+    assert contact_filter.get_stats() == STATS
+
+
+def test_stream_categorize_counts_only_what_it_yields():
+    contact_filter = ContactFilter()
+    stream = contact_filter.stream_categorize(PITCHES)
+
+    assert contact_filter.get_stats()['total_pitches_processed'] == 0
+
+    next(stream)
+    next(stream)
+
+    assert contact_filter.get_stats()['total_pitches_processed'] == 2
+    assert contact_filter.get_stats()['contact_events_found'] == 2
+    assert contact_filter._cache is None
+
+
+def test_stream_categorize_dataframe_rows():
+    pd = pytest.importorskip('pandas')
+    streamed = list(ContactFilter().stream_categorize(pd.DataFrame(PITCHES)))
+
+    assert streamed[0] == ('in_play', pd.DataFrame(PITCHES).iloc[0].to_dict())
+    assert [category for category, _ in streamed][-2:] == ['unknown', 'unknown']
+
+
+def test_pitch_batch_matches_list_input():
+    contact_filter = ContactFilter()
+    batch = PitchBatch.from_dicts(PITCHES)
+
+    assert contact_filter.get_contact_summary(batch) == CONTACT_SUMMARY
+    assert contact_filter.get_non_contact_summary(batch) == NON_CONTACT_SUMMARY
+    assert contact_filter.count_plate_appearances_by_contact(batch) == (5, 3)
+    assert batch.row(2) == {'pitch_call': 'StrikeSwinging', 'exit_speed': None, 'inning': 1, 'pa_of_inning': 2}
+
+
+def test_pitch_batch_from_frame_matches_from_dicts():
+    pd = pytest.importorskip('pandas')
+    from_frame = PitchBatch.from_frame(pd.DataFrame(PITCHES))
+    from_dicts = PitchBatch.from_dicts(PITCHES)
+
+    assert list(from_frame.pitch_call) == list(from_dicts.pitch_call)
+    np.testing.assert_array_equal(from_frame.exit_speed[[0, 1, 2, 3]], [101.2, 88.0, np.nan, 64.5])
+    np.testing.assert_array_equal(from_dicts.exit_speed[[0, 1, 2, 3]], [101.2, 88.0, np.nan, 64.5])
+    np.testing.assert_array_equal(from_frame.inning, from_dicts.inning)
+    np.testing.assert_array_equal(from_frame.pa_of_inning, from_dicts.pa_of_inning)
+    assert ContactFilter().count_plate_appearances_by_contact(pd.DataFrame(PITCHES)) == (5, 3)
+
+
+def test_none_inning_is_not_a_missing_inning():
+    pitches = [
+        {'pitch_call': 'BallCalled', 'inning': None, 'pa_of_inning': 1},
+        {'pitch_call': 'InPlay', 'pa_of_inning': 1}
+    ]
+
+    assert ContactFilter().count_non_contact_plate_appearances(pitches) == 1
+    assert PitchBatch.from_dicts(pitches).row(0)['inning'] is None
+
+
+def test_summaries_do_not_read_pa_fields():
+    contact_filter = ContactFilter()
+    pitches = [dict(p, inning=2 ** 40) for p in PITCHES]
+
+    assert contact_filter.get_contact_summary(pitches) == CONTACT_SUMMARY
+    assert contact_filter._cache[2][0].inning is None
+
+    assert contact_filter.count_plate_appearances_by_contact(pitches) == (2, 1)
+    assert contact_filter._cache[2][0].inning is not None
+
+
+def test_pitch_batch_without_pa_columns_cannot_count_pas():
+    batch = PitchBatch.from_dicts(PITCHES, pa_columns=False)
+
+    assert ContactFilter().get_contact_summary(batch) == CONTACT_SUMMARY
+    with pytest.raises(ValueError):
+        ContactFilter().count_plate_appearances_by_contact(batch)
+
+
+def test_none_inning_is_not_a_negative_inning():
+    pitches = [
+        {'pitch_call': 'InPlay', 'inning': -1, 'pa_of_inning': 2},
+        {'pitch_call': 'BallCalled', 'inning': None, 'pa_of_inning': 2}
+    ]
+
+    assert ContactFilter().count_plate_appearances_by_contact(pitches) == (1, 1)
+
+
+def test_non_integral_pa_field_is_rejected():
+    pitches = [{'pitch_call': 'InPlay', 'inning': 1.5, 'pa_of_inning': 1}]
+
+    with pytest.raises(ValueError):
+        ContactFilter().count_plate_appearances_by_contact(pitches)
+
+
+def test_pitch_batch_rows_keep_zero_exit_speed():
+    batch = PitchBatch.from_dicts([{'pitch_call': 'InPlay', 'exit_speed': 0, 'inning': 1, 'pa_of_inning': 1}])
+    result = ContactFilter().categorize_pitches(batch)
+
+    assert result['contact']['in_play'][0]['exit_speed'] == 0
+    assert ContactFilter().get_contact_summary(batch)['avg_exit_velo'] == 0
+
+
+def test_batches_and_counts_compare_without_raising():
+    contact_filter = ContactFilter()
+    batch = PitchBatch.from_dicts(PITCHES)
+    counts = contact_filter.categorize_counts(PITCHES)
+
+    assert batch == batch
+    assert PitchBatch.from_dicts(PITCHES) != batch
+    assert counts != contact_filter.categorize_counts(PITCHES)
+
+
+def test_rates_round_like_python_at_2000_pitches():
+    contact_filter = ContactFilter()
+    fouls = [{'pitch_call': 'FoulBall'}] + [{'pitch_call': 'BallCalled'}] * 1999
+    hit_by_pitch = [{'pitch_call': 'HitByPitch'}] + [{'pitch_call': 'BallCalled'}] * 1999
+
+    assert contact_filter.get_contact_summary(fouls)['foul_rate'] == round(1 / 2000 * 100, 1) == 0.1
+    assert contact_filter.get_non_contact_summary(hit_by_pitch)['hit_by_pitch_rate'] == 0.1